@@ -0,0 +1,102 @@
+"""Tests for the batch mode of the `run_client` script."""
+
+import json
+import os
+import time
+from importlib.machinery import SourceFileLoader
+from importlib.util import module_from_spec, spec_from_loader
+from threading import Lock
+
+import pytest
+
+pytest.importorskip("Ice")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(name="run_client")
+def fixture_run_client(monkeypatch):
+    """Load the `run_client` script as a module from the repository root."""
+    monkeypatch.chdir(REPO_ROOT)
+    loader = SourceFileLoader("run_client", os.path.join(REPO_ROOT, "run_client"))
+    module = module_from_spec(spec_from_loader("run_client", loader))
+    loader.exec_module(module)
+    return module
+
+
+class FakeAuthenticator:
+    """In-memory authenticator whose `addUser` is slower than `removeUser`."""
+
+    def __init__(self, iceflix):
+        self.iceflix = iceflix
+        self.users = {}
+        self.lock = Lock()
+
+    def addUser(self, user, password_hash, admin_token):  # pylint: disable=invalid-name
+        """Add a user after a delay, so a reordered removal would run first."""
+        time.sleep(0.1)
+        with self.lock:
+            self.users[user] = password_hash
+
+    def removeUser(self, user, admin_token):  # pylint: disable=invalid-name
+        """Remove a user or fail if it does not exist."""
+        with self.lock:
+            if user not in self.users:
+                raise self.iceflix.Unauthorized()
+            self.users.pop(user)
+
+
+class FakeMain:
+    """Main proxy that always returns the same authenticator."""
+
+    def __init__(self, authenticator):
+        self.authenticator = authenticator
+
+    def getAuthenticator(self):  # pylint: disable=invalid-name
+        """Return the fake authenticator."""
+        return self.authenticator
+
+
+def write_script(tmp_path, operations):
+    """Write the operations as a JSONL script and return its path."""
+    script = tmp_path / "ops.jsonl"
+    script.write_text("\n".join(json.dumps(operation) for operation in operations))
+    return str(script)
+
+
+def test_add_then_remove_runs_in_script_order(run_client, tmp_path, capsys):
+    """Operations on the same user keep the script order."""
+    authenticator = FakeAuthenticator(run_client.IceFlix)
+    client = run_client.Client()
+    client.main_proxy = FakeMain(authenticator)
+
+    script = write_script(tmp_path, [
+        {"op": "addUser", "user": "bob", "password": "pw", "admin_token": "admin"},
+        {"op": "removeUser", "user": "bob", "admin_token": "admin"},
+    ])
+
+    assert client.run_script(script, workers=4) == 0
+    assert "bob" not in authenticator.users
+    reports = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [report["op"] for report in reports] == ["addUser", "removeUser"]
+
+
+def test_malformed_lines_are_reported(run_client, tmp_path, capsys):
+    """Lines with unexpected value types are reported without stopping the batch."""
+    authenticator = FakeAuthenticator(run_client.IceFlix)
+    client = run_client.Client()
+    client.main_proxy = FakeMain(authenticator)
+
+    script = write_script(tmp_path, [
+        {"op": ["login"]},
+        {"op": "whois", "token": ["x"]},
+        {"op": "addUser", "user": "bob", "password": "pw", "admin_token": "admin"},
+    ])
+
+    assert client.run_script(script, workers=2) == 1
+    reports = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(reports) == 3
+    assert reports[0]["error"].startswith("Operación no válida")
+    assert reports[1]["error"].startswith("Operación no válida")
+    assert "error" not in reports[2]
+    assert "bob" in authenticator.users